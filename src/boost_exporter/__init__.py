@@ -1,12 +1,19 @@
 from .exporter import DataExporter
 from .formats import ExportFormat
 from .cache import ExportCache
-from .models import ExportRecord, validate_and_convert_records
+from .models import (
+    ExportRecord,
+    ExportRecordBatch,
+    validate_and_convert_records,
+    validate_batch,
+)
 
 __all__ = [
     "DataExporter",
     "ExportFormat",
     "ExportCache",
     "ExportRecord",
+    "ExportRecordBatch",
     "validate_and_convert_records",
+    "validate_batch",
 ]
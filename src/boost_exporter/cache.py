@@ -2,59 +2,111 @@ from __future__ import annotations
 
 import time
 from collections import OrderedDict
-from typing import Tuple
+from typing import Hashable, Literal
+
+# In "approx" LRU mode, an entry is moved to the most-recently-used end only on
+# every _PROMOTE_EVERY-th hit instead of on every hit; eviction gives entries with
+# hits since their last promotion a second chance.
+_PROMOTE_EVERY = 8
 
 
 class ExportCache:
     """In-memory cache with a TTL (default: 1 hour) and LRU eviction.
 
-    Stores export results keyed by a hash of the input data and format.
+    Stores export results keyed by a hash of the input data and format (or, for
+    small datasets, a tuple of their contents).
+    Each entry's expiry deadline is fixed on `set` from `time.monotonic()`, so
+    wall-clock adjustments (NTP, DST, manual changes) cannot expire or resurrect
+    entries, and a lookup only compares the deadline against the current time.
+    Changing `ttl_seconds` affects entries stored afterwards.
     Implements LRU eviction when max_size is reached to prevent unbounded memory growth.
 
+    Recency tracking has two modes:
+        - "strict" (default): every hit moves the entry to the most recently used
+          position.
+        - "approx": hits are counted and the entry is promoted on every 8th hit;
+          when evicting, an entry hit since its last promotion is moved to the
+          most recently used end (a second chance) instead of being dropped.
+          Recency is coarser than in strict mode, and with CPython's C
+          OrderedDict.move_to_end a hit is not cheaper than in strict mode.
+
     Thread Safety:
         This implementation is not thread-safe. For multi-threaded environments,
         external synchronization (e.g., locks) must be used when accessing the cache.
     """
 
-    def __init__(self, ttl_seconds: int = 3600, max_size: int = 1000) -> None:
+    # No instance __dict__: get()/set() read these on every call. Subclasses that
+    # don't declare __slots__ still get a __dict__ for their own attributes.
+    __slots__ = ("_store", "_expiry", "_touch_counter", "ttl_seconds", "max_size", "lru_mode")
+
+    def __init__(
+        self,
+        ttl_seconds: int = 3600,
+        max_size: int = 1000,
+        lru_mode: Literal["strict", "approx"] = "strict",
+    ) -> None:
         """Initialize cache with TTL and size limit.
 
         Args:
             ttl_seconds: Time-to-live in seconds (default: 3600 = 1 hour).
             max_size: Maximum number of entries before LRU eviction (default: 1000).
+            lru_mode: "strict" (default) for exact LRU order, "approx" for batched
+                      promotion of frequently hit entries.
+
+        Raises:
+            ValueError: if lru_mode is not "strict" or "approx".
         """
-        self._store: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+        if lru_mode not in ("strict", "approx"):
+            raise ValueError(f"lru_mode must be 'strict' or 'approx', got {lru_mode!r}")
+        # Values and their expiry deadlines live in two parallel mappings rather than
+        # as (deadline, value) tuples, saving a tuple allocation per entry. _store is an
+        # OrderedDict rather than a plain dict: move_to_end() and popitem(last=False)
+        # are O(1), whereas re-inserting into a plain dict leaves deleted slots at its
+        # front that every oldest-key lookup has to skip. The first key is the LRU one.
+        self._store: OrderedDict[Hashable, str] = OrderedDict()
+        self._expiry: dict[Hashable, float] = {}
+        # Hits since last promotion, per key (approx mode only).
+        self._touch_counter: dict[Hashable, int] = {}
         self.ttl_seconds = ttl_seconds
         self.max_size = max_size
+        self.lru_mode = lru_mode
 
-    def get(self, key: str) -> str | None:
+    def get(self, key: Hashable, now: float | None = None) -> str | None:
         """Get a cached export if present and not expired.
 
-        Moves the entry to the end (most recently used) if found.
+        Moves the entry to the end (most recently used) if found; in "approx" mode
+        only on every 8th hit.
 
         Args:
             key: Cache key.
+            now: Current `time.monotonic()` reading, if the caller already has one.
 
         Returns:
             Cached value if present and not expired, None otherwise.
         """
-        entry = self._store.get(key)
-        if not entry:
+        value = self._store.get(key)
+        if value is None:
             return None
 
-        ts, value = entry
-        now = time.time()
-        if now - ts > self.ttl_seconds:
+        if now is None:
+            now = time.monotonic()
+        if self._expiry[key] < now:
             # expired - remove it
-            self._store.pop(key, None)
+            self._remove(key)
             return None
 
-        # Move to end (most recently used) for LRU
-        self._store.move_to_end(key)
+        if self.lru_mode == "approx":
+            hits = self._touch_counter.get(key, 0) + 1
+            if hits < _PROMOTE_EVERY:
+                self._touch_counter[key] = hits
+                return value
+            self._touch_counter.pop(key, None)
+
+        self._store.move_to_end(key)  # most recently used
         return value
 
-    def set(self, key: str, data: str) -> None:
-        """Cache an export value with a timestamp for expiration checks.
+    def set(self, key: Hashable, data: str, now: float | None = None) -> None:
+        """Cache an export value with its expiry deadline.
 
         Evicts least recently used entry if max_size is reached.
         Note: This implementation is not thread-safe. For multi-threaded use,
@@ -63,16 +115,44 @@ class ExportCache:
         Args:
             key: Cache key.
             data: Value to cache.
+            now: Current `time.monotonic()` reading, if the caller already has one.
         """
+        if now is None:
+            now = time.monotonic()
+
         # If key exists, update it and move to end (most recently used)
         if key in self._store:
+            self._store[key] = data
             self._store.move_to_end(key)
-            self._store[key] = (time.time(), data)
+            self._expiry[key] = now + self.ttl_seconds
+            self._touch_counter.pop(key, None)
             return
 
         # For new keys, evict oldest if we're at capacity before adding
         if len(self._store) >= self.max_size:
-            self._store.popitem(last=False)  # Remove oldest (first) item
+            self._evict_oldest()
 
         # Add new entry
-        self._store[key] = (time.time(), data)
+        self._store[key] = data
+        self._expiry[key] = now + self.ttl_seconds
+
+    def _evict_oldest(self) -> None:
+        """Drop the least recently used entry, skipping ones hit since their last promotion.
+
+        Skipped entries are moved to the most recently used end with their hit count
+        cleared, so the loop ends after at most one pass over the store. The counts
+        are only ever set in "approx" mode; in strict mode this drops the first entry.
+        """
+        store = self._store
+        touch_counter = self._touch_counter
+        oldest = next(iter(store))
+        while touch_counter.pop(oldest, 0):
+            store.move_to_end(oldest)  # second chance
+            oldest = next(iter(store))
+        self._remove(oldest)
+
+    def _remove(self, key: Hashable) -> None:
+        """Drop an entry and its bookkeeping."""
+        del self._store[key]
+        del self._expiry[key]
+        self._touch_counter.pop(key, None)
@@ -1,15 +1,178 @@
 from __future__ import annotations
 
+import asyncio
 import csv
+import functools
 import hashlib
 import io
 import json
+import math
+import os
+import time as time_module
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, time
-from typing import Any
+from itertools import chain, compress, repeat
+from operator import attrgetter, is_, methodcaller
+from typing import Any, Callable, Generator, Hashable, Iterable, Iterator, Sequence
 
 from .cache import ExportCache
 from .formats import ExportFormat
-from .models import validate_and_convert_records
+from .models import ExportRecordBatch, validate_and_convert_records
+
+try:  # optional: `pip install boost-exporter[fast]`
+    import xxhash
+except ImportError:  # pragma: no cover - exercised only without the extra
+    xxhash = None
+
+try:  # optional: `pip install boost-exporter[fast]`
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None
+
+# orjson encodes datetime/date/time natively, so _json_default is only a fallback
+# for other types there. OPT_NON_STR_KEYS keeps int/float keys (which stdlib json
+# stringifies) on the fast path instead of failing over to json.dumps, and
+# OPT_SERIALIZE_NUMPY does the same for numpy scalars and arrays. OPT_NAIVE_UTC is
+# deliberately not used: it would append +00:00 to naive datetimes.
+_ORJSON_OPTIONS = (
+    orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if orjson is not None
+    else 0
+)
+
+# Cell types csv.writer already renders exactly like _to_primitive would
+# (None is written as an empty string).
+_CSV_PASSTHROUGH_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Datasets up to this many rows (of _SMALL_KEY_VALUE_TYPES values) are keyed by
+# their contents directly instead of by a hash of their canonical JSON.
+_SMALL_KEY_MAX_ROWS = 8
+_SMALL_KEY_VALUE_TYPES = frozenset({str, int, bool, type(None)})
+
+# export_many() only uses a thread pool once the datasets hold this many rows in total.
+_PARALLEL_MIN_ROWS = 10_000
+
+# Cache-key marker for results produced with DataExporter(validate_input=True).
+_VALIDATED = "validated"
+
+# Cell types that cannot be, or hold, a NaN or inf, and the cell types that
+# _has_non_finite_float checks (floats, and containers that may nest them).
+_FLAT_NON_FLOAT_TYPES = frozenset({str, int, bool, type(None), datetime, date, time})
+_SCANNED_TYPES = (float, dict, list, tuple)
+
+# A step of DataExporter._export_steps: a function to run, and its arguments.
+_Step = tuple[Callable[..., Any], tuple[Any, ...]]
+
+# Number of recently exported lists whose cache keys DataExporter(memoize_keys=True) keeps.
+_KEY_MEMO_SIZE = 128
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _empty(value: None) -> str:
+    return ""
+
+
+# ISO 8601 formatters keyed by exact date/time type, shared by the JSON and CSV paths.
+_ISO_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    time: time.isoformat,
+}
+
+# b"<format>:" prefix hashed ahead of the payload in cache keys, built once per format.
+_FORMAT_KEY_PREFIX: dict[ExportFormat, bytes] = {
+    fmt: f"{fmt.value}:".encode("utf-8") for fmt in ExportFormat
+}
+
+# Exact-type handlers for DataExporter._to_primitive; other types use its isinstance chain.
+_PRIMITIVE_DISPATCH: dict[type, Callable[[Any], str | int | float | bool]] = {
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    type(None): _empty,
+    **_ISO_FORMATTERS,
+}
+
+# Date/time types whose CSV columns can be ISO-formatted in one pass, and how many
+# leading values are checked for repeats before a column is formatted via the memo.
+_ISO_TYPES = frozenset(_ISO_FORMATTERS)
+_ISO_MEMO_SAMPLE = 100
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _cached_isoformat(value: datetime | date | time) -> str:
+    """Memoized isoformat() for naive date/time values that repeat across rows."""
+    return value.isoformat()
+
+
+def _has_non_finite_float(data: list[dict[str, Any]] | dict[str, list[Any]]) -> bool:
+    """Return True if rows (or a batch's columns) hold a NaN or inf, at any depth.
+
+    C-level passes collect the cells and their types first, so data without float
+    or container cells is cleared without looking at any value. Float cells are
+    then summed, as a NaN or inf makes the sum non-finite (a finite sum that
+    overflows only costs a needless stdlib encode); only cells that are float
+    subclasses or containers are walked in Python.
+    """
+    cells = list(
+        chain.from_iterable(data.values() if isinstance(data, dict) else map(dict.values, data))
+    )
+    cell_types = set(map(type, cells))
+    if cell_types <= _FLAT_NON_FLOAT_TYPES:
+        return False
+    if float in cell_types:
+        floats = compress(cells, map(is_, map(type, cells), repeat(float)))
+        if not math.isfinite(sum(floats, 0.0)):
+            return True
+    # Float subclasses and containers: check those cells one by one.
+    suspect = {t for t in cell_types if t is not float and issubclass(t, _SCANNED_TYPES)}
+    if not suspect:
+        return False
+    suspect_cells = compress(cells, map(suspect.__contains__, map(type, cells)))
+    return any(map(_nested_non_finite_float, suspect_cells))
+
+
+def _nested_non_finite_float(value: Any) -> bool:
+    """Return True if `value` (searched through dicts, lists and tuples) holds a NaN or inf."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(map(_nested_non_finite_float, value.values()))
+    if isinstance(value, (list, tuple)):
+        return any(map(_nested_non_finite_float, value))
+    return False
+
+
+def _call_step(step: _Step) -> Any:
+    """Run one `(func, args)` step yielded by DataExporter._export_steps."""
+    func, args = step
+    return func(*args)
+
+
+def _hash_key_parts(*parts: bytes) -> bytes:
+    """Hash cache-key parts incrementally and return the raw digest.
+
+    Uses XXH3-128 when xxhash is installed, otherwise the stdlib's BLAKE2b,
+    which is faster than SHA-256 on 64-bit CPUs; both produce 128-bit
+    digests. Cache keys only need collision resistance against accidental
+    collisions, not a cryptographic hash, so the fastest available one is used.
+    Raw digest bytes are kept as keys: half the size of a hex string and just as
+    fast to hash and compare in a dict.
+    """
+    if xxhash is not None:
+        hasher = xxhash.xxh3_128()
+        for part in parts:
+            hasher.update(part)
+        return hasher.digest()
+
+    hasher = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        hasher.update(part)
+    return hasher.digest()
 
 
 class DataExporter:
@@ -23,15 +186,36 @@ class DataExporter:
         This class uses ExportCache which is not thread-safe. For multi-threaded
         use, either provide a thread-safe cache implementation or use external
         synchronization when sharing a DataExporter instance across threads.
+        `export_many` and `export_async` use worker threads internally but only
+        access the cache from the calling thread (or event loop).
     """
 
-    cache: ExportCache
+    # Slots make the per-export attribute reads plain descriptor loads and drop the
+    # instance __dict__; subclasses that don't declare __slots__ get one back.
+    __slots__ = (
+        "_cache",
+        "_cache_get",
+        "_cache_set",
+        "validate_input",
+        "validate_on_hit",
+        "memoize_keys",
+        "cache_min_rows",
+        "_key_memo",
+    )
+
+    _cache: ExportCache
     validate_input: bool
+    validate_on_hit: bool
+    memoize_keys: bool
+    cache_min_rows: int
 
     def __init__(
         self,
         cache: ExportCache | None = None,
-        validate_input: bool = False
+        validate_input: bool = False,
+        memoize_keys: bool = False,
+        validate_on_hit: bool = True,
+        cache_min_rows: int = 0,
     ) -> None:
         """Initialize exporter with optional cache and validation.
 
@@ -39,15 +223,71 @@ class DataExporter:
             cache: Optional cache instance; otherwise create one.
             validate_input: If True, validate input data structure using attrs.
                           This demonstrates Boost's preferred validation approach.
+                          Validation runs before the cache is consulted (see
+                          validate_on_hit).
+            memoize_keys: If True, remember the cache key of recently exported list
+                          (or ExportRecordBatch) objects so exporting the *same*
+                          object again skips hashing it.
+                          Only a change in length is detected: callers must not
+                          modify rows in place between exports when this is enabled.
+                          The exporter keeps a reference to each of the last 128
+                          exported lists or batches (so their ids stay unique),
+                          which keeps them alive after the caller drops them.
+            validate_on_hit: If False (and validate_input is True), validate on cache
+                          misses only. Cache keys are computed from the canonical
+                          JSON, which does not record value types, so invalid rows
+                          (e.g. ISO strings where datetimes are required) can then
+                          hit the entry of valid data and be exported without an
+                          error. Only use this when inputs are known to be well
+                          typed. Validated results are cached under their own keys,
+                          so a cache shared with a non-validating exporter never
+                          serves them unvalidated output. Defaults to True.
+            cache_min_rows: Datasets with fewer rows than this are exported without
+                          computing a cache key or touching the cache, for callers
+                          whose tiny exports are cheaper to redo than to hash.
+                          The default (0) caches every export.
         """
         self.cache = cache or ExportCache()
         self.validate_input = validate_input
+        self.validate_on_hit = validate_on_hit
+        self.memoize_keys = memoize_keys
+        self.cache_min_rows = cache_min_rows
+        # (id(data), format) -> (data, len(data), cache key). The list or batch itself
+        # is kept so its id cannot be reused by another object while the entry exists.
+        self._key_memo: dict[
+            tuple[int, ExportFormat], tuple[list[Any] | ExportRecordBatch, int, Hashable]
+        ] = {}
+
+    @property
+    def cache(self) -> ExportCache:
+        """Cache used for export results."""
+        return self._cache
 
-    def export(self, data: list[dict[str, Any]], export_format: ExportFormat) -> str:
+    @cache.setter
+    def cache(self, cache: ExportCache) -> None:
+        self._cache = cache
+        # Resolve the bound methods once here instead of on every export() call. Only
+        # ExportCache's own get/set take the shared `now`; overrides in subclasses may
+        # predate it, so they are called with the original (key[, data]) signature.
+        cache_type = type(cache)
+        get, set_ = cache.get, cache.set
+        if getattr(cache_type, "get", None) is ExportCache.get:
+            self._cache_get = get
+        else:
+            self._cache_get = lambda key, now: get(key)
+        if getattr(cache_type, "set", None) is ExportCache.set:
+            self._cache_set = set_
+        else:
+            self._cache_set = lambda key, data, now: set_(key, data)
+
+    def export(
+        self, data: list[dict[str, Any]] | ExportRecordBatch, export_format: ExportFormat
+    ) -> str:
         """Export to the requested format with basic validation and caching.
 
         Args:
-            data: list of dictionaries representing rows.
+            data: list of dictionaries representing rows, or a columnar
+                ExportRecordBatch.
             export_format: ExportFormat.CSV or ExportFormat.JSON.
 
         Returns:
@@ -57,75 +297,376 @@ class DataExporter:
             ValueError: when data is not a list[dict] or format unsupported.
             ValueError: when validate_input=True and data structure is invalid.
         """
-        self._validate_data(data)
+        self._check_input(data)
+        return self._run_steps(self._export_steps(data, export_format))
 
-        # Optional validation using attrs (Boost's preferred approach)
-        if self.validate_input:
-            # This validates data structure matches ExportRecord schema
-            # Raises ValueError if structure is invalid
-            validate_and_convert_records(data, strict=False)
+    def export_many(
+        self,
+        datasets: list[list[dict[str, Any]] | ExportRecordBatch],
+        export_format: ExportFormat,
+        max_workers: int | None = None,
+    ) -> list[str]:
+        """Export several datasets, computing keys and outputs on a thread pool.
+
+        Equivalent to `[self.export(d, export_format) for d in datasets]`, but for
+        large inputs the per-dataset cache-key computation (canonical JSON + hash;
+        hashlib releases the GIL on large buffers) and the rendering of cache misses
+        run in parallel. The cache itself is only touched from the calling thread,
+        so ExportCache needs no locking.
+
+        Args:
+            datasets: list of datasets, each a list of dictionaries or an
+                ExportRecordBatch.
+            export_format: ExportFormat.CSV or ExportFormat.JSON.
+            max_workers: Thread pool size (default: os.cpu_count()).
+
+        Returns:
+            Exported texts, in the same order as `datasets`.
+
+        Raises:
+            ValueError: same conditions as `export`, checked for every dataset
+                before any work starts.
+        """
+        for data in datasets:
+            self._check_input(data)
+
+        if len(datasets) < 2 or sum(map(len, datasets)) < _PARALLEL_MIN_ROWS:
+            return [self._run_steps(self._export_steps(d, export_format)) for d in datasets]
+
+        # Run every dataset's export flow in lockstep: each round, the pending
+        # keying/rendering steps of all datasets go to the pool together, while the
+        # flows themselves (and with them the cache) only advance on this thread.
+        flows = [self._export_steps(data, export_format) for data in datasets]
+        results: list[str] = [""] * len(datasets)
+        sends: dict[int, Any] = dict.fromkeys(range(len(datasets)))
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+            while sends:
+                pending: dict[int, _Step] = {}
+                for i, value in sends.items():
+                    try:
+                        pending[i] = flows[i].send(value)
+                    except StopIteration as done:
+                        results[i] = done.value
+                sends = dict(zip(pending, pool.map(_call_step, pending.values())))
+        return results
+
+    async def export_async(
+        self, data: list[dict[str, Any]] | ExportRecordBatch, export_format: ExportFormat
+    ) -> str:
+        """Export without blocking the event loop.
 
-        # Compute cache key - necessary to check cache, but can be expensive for large datasets
-        key = self._compute_cache_key(data, export_format)
-        cached = self.cache.get(key)
+        Same result as `export`, but the cache-key computation and, on a miss, the
+        rendering run on the loop's default executor, where orjson and hashlib can
+        encode and hash large payloads without holding up other coroutines. The
+        cache (and the `memoize_keys` memo) is only accessed from the event loop
+        thread, so concurrent calls need no locking.
+
+        Raises:
+            ValueError: same conditions as `export`.
+        """
+        self._check_input(data)
+        loop = asyncio.get_running_loop()
+        steps = self._export_steps(data, export_format)
+        value = None
+        try:
+            while True:
+                func, args = steps.send(value)
+                value = await loop.run_in_executor(None, func, *args)
+        except StopIteration as done:
+            return done.value
+
+    # -------------------- internals --------------------
+    def _check_input(self, data: list[dict[str, Any]] | ExportRecordBatch) -> None:
+        """Checks that run before the cache is consulted; raise ValueError on bad input."""
+        if not isinstance(data, ExportRecordBatch):
+            self._validate_data(data)
+        if self.validate_on_hit:
+            self._validate_records(data)
+
+    def _export_steps(
+        self, data: list[dict[str, Any]] | ExportRecordBatch, export_format: ExportFormat
+    ) -> Generator[_Step, Any, str]:
+        """The export flow shared by every entry point, for input `_check_input` accepted.
+
+        The expensive steps (computing the cache key, rendering) are yielded as
+        `(func, args)` and their results sent back, so `export` can run them inline,
+        `export_many` on a thread pool and `export_async` on an executor. Everything
+        else, including every cache and memo access, runs in the caller's thread.
+        """
+        if len(data) < self.cache_min_rows:
+            if not self.validate_on_hit:
+                self._validate_records(data)
+            return (yield self._render, (data, export_format, None))
+
+        payload: bytes | None = None
+        key = self._memoized_key(data, export_format) if self.memoize_keys else None
+        if key is None:
+            key, payload = yield self._key_and_payload, (data, export_format)
+            if self.memoize_keys:
+                self._remember_key(data, export_format, key)
+        if self.validate_input:
+            # Validated results get their own keys, so they are never served from an
+            # entry that a non-validating exporter (or call) stored in the same cache.
+            key = (key, _VALIDATED)
+        now = time_module.monotonic()  # one clock read shared by cache get/set
+        cached = self._cache_get(key, now)
         if cached is not None:
             return cached
 
-        if export_format == ExportFormat.JSON:
-            result = self._to_json(data)
-        elif export_format == ExportFormat.CSV:
-            result = self._to_csv(data)
-        else:
-            raise ValueError(f"Unsupported export format: {export_format}")
+        if not self.validate_on_hit:
+            self._validate_records(data)
 
-        self.cache.set(key, result)
+        result = yield self._render, (data, export_format, payload)
+        self._cache_set(key, result, now)
         return result
 
-    # -------------------- internals --------------------
+    @staticmethod
+    def _run_steps(steps: Generator[_Step, Any, str]) -> str:
+        """Drive `_export_steps` to completion, running each step inline."""
+        value = None
+        try:
+            while True:
+                func, args = steps.send(value)
+                value = func(*args)
+        except StopIteration as done:
+            return done.value
+
+    def _key_and_payload(
+        self, data: list[dict[str, Any]] | ExportRecordBatch, export_format: ExportFormat
+    ) -> tuple[Hashable, bytes | None]:
+        """Compute the cache key and, for JSON exports, the canonical JSON.
+
+        Computing the key is necessary to check the cache, but can be expensive for
+        large datasets. Small datasets get a hash-free key; otherwise the canonical
+        JSON is hashed, and it doubles as the JSON output so data is only serialized
+        once. For other formats the payload is dropped as soon as it is hashed, so a
+        copy of the serialized dataset is not kept alive while the CSV is rendered
+        (or, in `export_many`, one copy per dataset). Has no side effects, so it is
+        safe to run on worker threads.
+        """
+        if isinstance(data, ExportRecordBatch):
+            return self._batch_key(data.columns(), export_format), None
+        key = self._small_cache_key(data, export_format)
+        if key is not None:
+            return key, None
+        try:
+            payload = self._serialize_json_canonical(data)
+        except TypeError:
+            # Not JSON serializable, or keys of mixed types that cannot be sorted:
+            # key on repr() and let _to_json produce (or reject) the output.
+            fallback = repr(data).encode("utf-8")
+            return _hash_key_parts(_FORMAT_KEY_PREFIX[export_format], fallback), None
+        key = self._compute_cache_key(data, export_format, payload)
+        if export_format != ExportFormat.JSON:
+            payload = None
+        return key, payload
+
+    def _render(
+        self,
+        data: list[dict[str, Any]] | ExportRecordBatch,
+        export_format: ExportFormat,
+        payload: bytes | None,
+    ) -> str:
+        """Produce the export text (no caching); `payload` is reused for JSON."""
+        if isinstance(data, ExportRecordBatch):
+            return self._render_batch(data, data.columns(), export_format)
+        if export_format == ExportFormat.JSON:
+            return self._to_json(data, payload)
+        if export_format == ExportFormat.CSV:
+            return self._to_csv(data)
+        raise ValueError(f"Unsupported export format: {export_format}")
+
+    def _validate_records(self, data: list[dict[str, Any]] | ExportRecordBatch) -> None:
+        """Optional validation using attrs (Boost's preferred approach).
+
+        Validates that the data structure matches the ExportRecord schema when
+        validate_input is enabled; raises ValueError if it does not.
+        """
+        if self.validate_input:
+            if isinstance(data, ExportRecordBatch):
+                data = data.to_dicts()
+            validate_and_convert_records(data, strict=False)
+
+    def _memoized_key(
+        self, data: list[dict[str, Any]] | ExportRecordBatch, export_format: ExportFormat
+    ) -> Hashable | None:
+        """Return the remembered cache key for this exact list or batch, if still valid."""
+        entry = self._key_memo.get((id(data), export_format))
+        if entry is None or entry[0] is not data or entry[1] != len(data):
+            return None
+        return entry[2]
+
+    def _remember_key(
+        self,
+        data: list[dict[str, Any]] | ExportRecordBatch,
+        export_format: ExportFormat,
+        key: Hashable,
+    ) -> None:
+        """Remember a list's or batch's cache key, keeping at most _KEY_MEMO_SIZE recent lists."""
+        memo = self._key_memo
+        memo_key = (id(data), export_format)
+        memo.pop(memo_key, None)
+        if len(memo) >= _KEY_MEMO_SIZE:
+            del memo[next(iter(memo))]  # oldest entry
+        memo[memo_key] = (data, len(data), key)
+
+    def _batch_key(self, columns: dict[str, list[Any]], export_format: ExportFormat) -> bytes:
+        """Cache key of a batch, computed from its columns.
+
+        The b"batch:" prefix keeps these keys apart from those of row-oriented exports.
+        """
+        try:
+            payload = self._serialize_json_canonical(columns)
+        except TypeError:
+            # Values outside the JSON types (e.g. Decimal): key on repr(), as for rows.
+            payload = repr(columns).encode("utf-8")
+        return _hash_key_parts(b"batch:", _FORMAT_KEY_PREFIX[export_format], payload)
+
+    def _render_batch(
+        self, batch: ExportRecordBatch, columns: dict[str, list[Any]], export_format: ExportFormat
+    ) -> str:
+        """Produce the export text of a batch (no caching)."""
+        if export_format == ExportFormat.JSON:
+            return self._to_json(batch.to_dicts())
+        if export_format == ExportFormat.CSV:
+            return self._columns_to_csv(list(columns), list(columns.values()), len(batch))
+        raise ValueError(f"Unsupported export format: {export_format}")
+
     @staticmethod
     def _validate_data(data: Any) -> None:
         """Validate that data is a list of dictionaries."""
         if not isinstance(data, list):
             raise ValueError("data must be a list of dictionaries")
-        for idx, row in enumerate(data):
-            if not isinstance(row, dict):
-                raise ValueError(f"data[{idx}] is not a dict")
+        # all(map(...)) checks every row in C; the index is only looked up on failure.
+        if not all(map(isinstance, data, repeat(dict))):
+            idx = next(i for i, row in enumerate(data) if not isinstance(row, dict))
+            raise ValueError(f"data[{idx}] is not a dict")
 
     @staticmethod
     def _json_default(obj: Any) -> str:
         """JSON serializer for datetime objects."""
+        formatter = _ISO_FORMATTERS.get(type(obj))
+        if formatter is not None:
+            return formatter(obj)
         if isinstance(obj, (datetime, date, time)):
             return obj.isoformat()
         raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
     @staticmethod
-    def _compute_cache_key(data: list[dict[str, Any]], export_format: ExportFormat) -> str:
-        """Compute a stable key from canonical JSON + format name."""
-        try:
-            payload = json.dumps(
-                data,
-                ensure_ascii=False,
-                sort_keys=True,
-                separators=(",", ":"),
-                default=DataExporter._json_default,
-            )
-        except TypeError:
-            # For non-JSON-serializable objects, use repr as fallback.
-            # This may cause cache misses for equivalent objects with different reprs,
-            # but ensures the export can still proceed.
-            payload = repr(data)
-        raw = f"{export_format.value}:{payload}".encode("utf-8")
-        return hashlib.sha256(raw).hexdigest()
+    def _serialize_json_canonical(data: list[dict[str, Any]]) -> bytes:
+        """Serialize data to canonical (sorted-key, compact) UTF-8 JSON bytes.
+
+        This single representation is used both for the cache key and as the
+        JSON export, so JSON exports serialize the data only once. orjson is
+        used when installed and able to encode the data; stdlib json otherwise.
+
+        orjson writes NaN and +/-inf as null, while stdlib json keeps them as NaN
+        and Infinity. orjson output containing a null has its float cells checked
+        (see _has_non_finite_float), and data holding such floats goes through
+        stdlib json, so they are never lost. The two backends may still format the same float differently (e.g.
+        1e16 vs 1e+16); the parsed values are identical.
+
+        Raises:
+            TypeError: when data contains values that are not JSON serializable.
+        """
+        if orjson is not None:
+            try:
+                payload = orjson.dumps(
+                    data, default=DataExporter._json_default, option=_ORJSON_OPTIONS
+                )
+            except TypeError:
+                pass  # e.g. ints beyond 64 bits; let stdlib json decide
+            else:
+                if b"null" not in payload or not _has_non_finite_float(data):
+                    return payload
+        return json.dumps(
+            data,
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":"),
+            default=DataExporter._json_default,
+        ).encode("utf-8")
+
+    @staticmethod
+    def _small_cache_key(
+        data: list[dict[str, Any]], export_format: ExportFormat
+    ) -> Hashable | None:
+        """Build a hash-free cache key for small datasets of simple scalars.
+
+        For a handful of rows, serializing and hashing costs more than the export
+        itself, so the key is the rows' sorted items as nested tuples. Each value
+        is paired with its type so that e.g. 1 and True do not share a key.
+
+        Returns None when data is too large or holds values whose equality does
+        not imply identical output (floats: 0.0 == -0.0; aware datetimes compare
+        equal across time zones), in which case the hashed key is used.
+        """
+        if len(data) > _SMALL_KEY_MAX_ROWS:
+            return None
+        rows = []
+        for row in data:
+            items = []
+            for k, v in row.items():
+                if type(k) is not str or type(v) not in _SMALL_KEY_VALUE_TYPES:
+                    return None
+                items.append((k, type(v), v))
+            items.sort()
+            rows.append(tuple(items))
+        return (export_format, tuple(rows))
+
+    @staticmethod
+    def _compute_cache_key(
+        data: list[dict[str, Any]],
+        export_format: ExportFormat,
+        payload: bytes | None = None,
+    ) -> Hashable:
+        """Compute a stable key from canonical JSON + format name.
+
+        Small datasets of simple scalars get a tuple key (see `_small_cache_key`).
+
+        Args:
+            data: Rows to key on.
+            export_format: Target format, mixed into the key.
+            payload: Pre-computed bytes from `_serialize_json_canonical`, if the
+                caller already has them.
+        """
+        if payload is None:
+            small_key = DataExporter._small_cache_key(data, export_format)
+            if small_key is not None:
+                return small_key
+            try:
+                payload = DataExporter._serialize_json_canonical(data)
+            except TypeError:
+                # For non-JSON-serializable objects, use repr as fallback.
+                # This may cause cache misses for equivalent objects with different reprs,
+                # but ensures the export can still proceed.
+                payload = repr(data).encode("utf-8")
+        return _hash_key_parts(_FORMAT_KEY_PREFIX[export_format], payload)
 
     @classmethod
-    def _to_json(cls, data: list[dict[str, Any]]) -> str:
-        """Convert data to JSON string."""
+    def _to_json(cls, data: list[dict[str, Any]], payload: bytes | None = None) -> str:
+        """Convert data to JSON string.
+
+        If `payload` (bytes from `_serialize_json_canonical`) is given it is
+        decoded and returned as-is instead of serializing `data` again. Rows whose
+        keys cannot be sorted (e.g. a mix of int and str keys without orjson) are
+        written compactly with their keys in insertion order instead.
+        """
         if not data:
             return "[]"  # empty edge case
-        try:
-            return json.dumps(data, ensure_ascii=False, default=cls._json_default)
-        except (TypeError, ValueError) as e:
-            raise ValueError(f"Failed to encode JSON: {e}") from e
+        if payload is None:
+            try:
+                payload = cls._serialize_json_canonical(data)
+            except TypeError:
+                try:
+                    return json.dumps(
+                        data, ensure_ascii=False, separators=(",", ":"), default=cls._json_default
+                    )
+                except (TypeError, ValueError) as e:
+                    raise ValueError(f"Failed to encode JSON: {e}") from e
+            except ValueError as e:
+                raise ValueError(f"Failed to encode JSON: {e}") from e
+        return payload.decode("utf-8")
 
     @staticmethod
     def _to_primitive(value: Any) -> str | int | float | bool:
@@ -135,7 +676,18 @@ class DataExporter:
         - primitives unchanged
         - datetime/date/time -> ISO 8601 string
         - other structures JSON-encoded, with str() as last resort
+
+        Exact built-in types are handled through a `type(value)` table lookup;
+        anything else (including subclasses) goes through `_slow_to_primitive`.
         """
+        handler = _PRIMITIVE_DISPATCH.get(type(value))
+        if handler is not None:
+            return handler(value)
+        return DataExporter._slow_to_primitive(value)
+
+    @staticmethod
+    def _slow_to_primitive(value: Any) -> str | int | float | bool:
+        """isinstance-based fallback for `_to_primitive`."""
         if value is None:
             return ""
         if isinstance(value, (str, int, float, bool)):
@@ -153,17 +705,114 @@ class DataExporter:
 
         # Column order: first row's keys, then any new keys appended in discovery order.
         header = list(data[0].keys())
-        seen = set(header)
-        for row in data:
-            for k in row.keys():
-                if k not in seen:
-                    header.append(k)
-                    seen.add(k)
+        uniform = all(map(header.__eq__, map(list, data)))  # same keys, same order
+        if not uniform:
+            # dict.fromkeys keeps first-seen order and runs the union loop in C.
+            header = list(dict.fromkeys(chain.from_iterable(data)))
 
+        # Fast paths: uniform rows of csv-native primitives can be written straight
+        # from each row's values without building any intermediate table.
+        cell_types = (
+            set(map(type, chain.from_iterable(map(dict.values, data)))) if uniform else None
+        )
+        if cell_types is not None and cell_types <= _CSV_PASSTHROUGH_TYPES:
+            if (
+                type(None) not in cell_types
+                and len(header) > 1
+                and all(type(k) is str for k in header)
+            ):
+                joined = self._join_plain_rows(header, data)
+                if joined is not None:
+                    return joined
+            buf, writer = self._csv_writer_with_header(header)
+            writer.writerows(map(dict.values, data))
+            return buf.getvalue()
+
+        # Otherwise build the table column by column. Uniform rows are transposed in
+        # one C-level zip() over their values; ragged rows need a get() per column.
+        columns: list[Sequence[Any]]
+        if uniform:
+            columns = list(zip(*map(dict.values, data)))
+        else:
+            columns = [list(map(methodcaller("get", k), data)) for k in header]
+        return self._columns_to_csv(header, columns, len(data))
+
+    @staticmethod
+    def _isoformat_column(column: Sequence[Any], cell_type: type) -> Iterator[str]:
+        """ISO-format a column holding only `cell_type` (datetime, date or time).
+
+        Batched events often repeat timestamps, so if the first values already
+        contain duplicates the column is formatted through a shared memo. Aware
+        values are never memoized: equal aware datetimes in different time zones
+        format differently.
+        """
+        sample = column[:_ISO_MEMO_SAMPLE]
+        if len(set(sample)) < len(sample) and (
+            cell_type is date or set(map(attrgetter("tzinfo"), column)) == {None}
+        ):
+            return map(_cached_isoformat, column)
+        return map(cell_type.isoformat, column)
+
+    @staticmethod
+    def _csv_writer_with_header(header: list[Any]) -> tuple[io.StringIO, Any]:
+        """Create a StringIO-backed csv.writer with the header row already written.
+
+        Headers made only of identifier-like names (e.g. snake_case columns) never
+        need quoting, so they are joined directly instead of going through the writer.
+        """
         buf = io.StringIO()
-        writer = csv.DictWriter(buf, fieldnames=header, extrasaction="ignore")
-        writer.writeheader()
-        for row in data:
-            safe_row = {k: self._to_primitive(row.get(k)) for k in header}
-            writer.writerow(safe_row)
+        writer = csv.writer(buf)
+        if all(type(k) is str and k.isidentifier() for k in header):
+            buf.write(",".join(header) + "\r\n")
+        else:
+            writer.writerow(header)
+        return buf, writer
+
+    @staticmethod
+    def _join_plain_rows(header: list[Any], data: list[dict[str, Any]]) -> str | None:
+        """Format rows by joining str() of each value, bypassing the csv module.
+
+        Only valid for uniform rows of str/int/float/bool with at least two
+        columns and str keys, where str() matches what csv.writer emits (it
+        writes a None key as an empty field, for example). Returns None if any
+        cell would need quoting (a comma, quote or line break), so the caller
+        can fall back to csv.writer.
+        """
+        lines = [",".join(map(str, header))]
+        lines += [",".join(map(str, row.values())) for row in data]
+        out = "\r\n".join(lines)
+        breaks = len(lines) - 1
+        if (
+            '"' in out
+            or out.count("\n") != breaks
+            or out.count("\r") != breaks
+            or out.count(",") != (len(header) - 1) * len(lines)
+        ):
+            return None
+        return out + "\r\n"
+
+    def _columns_to_csv(self, header: list[str], columns: list[Sequence[Any]], n_rows: int) -> str:
+        """Write column-oriented data as CSV with a header row.
+
+        Checking a column's cell types is a C-level map() call, and only columns
+        holding something other than csv-native primitives pay for a per-cell
+        _to_primitive() call. Converted columns stay lazy iterators, so rows are
+        streamed into the writer without building a second copy of each column.
+        """
+        to_primitive = self._to_primitive
+        converted: list[Iterable[Any]] = []
+        for column in columns:
+            cell_types = set(map(type, column))
+            if cell_types <= _CSV_PASSTHROUGH_TYPES:
+                converted.append(column)
+            elif len(cell_types) == 1 and cell_types <= _ISO_TYPES:
+                converted.append(self._isoformat_column(column, cell_types.pop()))
+            else:
+                converted.append(map(to_primitive, column))
+
+        buf, writer = self._csv_writer_with_header(header)
+        if converted:
+            writer.writerows(zip(*converted))
+        else:
+            writer.writerows([] for _ in range(n_rows))  # only empty dicts: blank rows
         return buf.getvalue()
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import functools
+import math
 from datetime import datetime
-from typing import Any, Union
+from itertools import repeat
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Union
 
 import attrs
 
 
-@attrs.define(frozen=True, slots=True)
+@attrs.define(frozen=True, slots=True, weakref_slot=False)
 class ExportRecord:
     """Structured data model for export records using attrs.
 
@@ -35,14 +39,239 @@ class ExportRecord:
     created_at: datetime = attrs.field(validator=attrs.validators.instance_of(datetime))
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for export compatibility."""
-        return attrs.asdict(self)
+        """Convert to dictionary for export compatibility.
+
+        Same result as `attrs.asdict(self)` (no field holds a nested attrs class or
+        collection), built as a constant-key dict literal from direct slot reads.
+        """
+        if type(self) is not ExportRecord:
+            return attrs.asdict(self)  # subclasses may add fields
+        return {
+            "event_type": self.event_type,
+            "location_name": self.location_name,
+            "sku_name": self.sku_name,
+            "quantity": self.quantity,
+            "value": self.value,
+            "created_at": self.created_at,
+        }
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> ExportRecord:
-        """Create from dictionary with validation."""
+    def from_dict(cls, data: dict[str, Any], intern: bool = False) -> ExportRecord:
+        """Create from dictionary with validation.
+
+        With `intern=True`, valid rows are looked up in a bounded cache of records,
+        so repeated identical rows share one (immutable) instance instead of each
+        allocating its own. Values are matched by type as well as equality, the
+        numbers also by sign (0.0 == -0.0) and `created_at` also by time zone and
+        fold, so a shared record always holds values equivalent to the row's.
+        """
+        if cls is ExportRecord:
+            if intern and _row_is_valid(data):
+                created_at = data["created_at"]
+                return _interned_record(
+                    *_FIELD_GETTER(data),
+                    created_at.tzinfo,
+                    created_at.fold,
+                    math.copysign(1.0, data["quantity"]),
+                    math.copysign(1.0, data["value"]),
+                )
+            return _fast_from_dict(data)
         return cls(**data)
 
+    @classmethod
+    def from_dict_unchecked(cls, data: dict[str, Any]) -> ExportRecord:
+        """Create from a trusted dictionary without running the field validators.
+
+        Only the key set is enforced (a missing or unexpected key raises
+        TypeError). Use `validate_batch` to check the records afterwards.
+        """
+        return cls._unchecked(**data)
+
+    @classmethod
+    def _unchecked(
+        cls,
+        event_type: str,
+        location_name: str,
+        sku_name: str,
+        quantity: Union[int, float],
+        value: Union[int, float],
+        created_at: datetime,
+    ) -> ExportRecord:
+        """Create a record without running attrs validators (private).
+
+        Only for values that were already validated, e.g. rows that passed
+        `_row_is_valid`. Fills the slots directly, skipping `__init__`.
+        """
+        obj = object.__new__(cls)
+        setattr_ = object.__setattr__
+        setattr_(obj, "event_type", event_type)
+        setattr_(obj, "location_name", location_name)
+        setattr_(obj, "sku_name", sku_name)
+        setattr_(obj, "quantity", quantity)
+        setattr_(obj, "value", value)
+        setattr_(obj, "created_at", created_at)
+        return obj
+
+
+@attrs.define(slots=True)
+class ExportRecordBatch:
+    """Columnar (structure-of-arrays) form of a list of ExportRecord rows.
+
+    Holds one list per ExportRecord field instead of one object or dict per row,
+    which is more compact and lets exporters convert a whole column at once
+    (e.g. one isoformat pass over `created_at`). Columns are not validated;
+    use `validate_and_convert_records` on the source rows if needed.
+
+    Example:
+        >>> batch = ExportRecordBatch.from_dicts(rows)
+        >>> DataExporter().export(batch, ExportFormat.CSV)
+    """
+    event_type: list[str]
+    location_name: list[str]
+    sku_name: list[str]
+    quantity: list[Union[int, float]]
+    value: list[Union[int, float]]
+    created_at: list[datetime]
+
+    def __attrs_post_init__(self) -> None:
+        if len({len(column) for column in self.columns().values()}) > 1:
+            raise ValueError("ExportRecordBatch columns must all have the same length")
+
+    def __len__(self) -> int:
+        return len(self.event_type)
+
+    @classmethod
+    def from_dicts(cls, data: list[dict[str, Any]]) -> ExportRecordBatch:
+        """Build a batch from ExportRecord-shaped dicts (one C-level pass per column)."""
+        return cls(**{name: list(map(itemgetter(name), data)) for name in _BATCH_FIELD_NAMES})
+
+    @classmethod
+    def from_records(cls, records: list[ExportRecord]) -> ExportRecordBatch:
+        """Build a batch from ExportRecord instances."""
+        return cls(**{name: list(map(attrgetter(name), records)) for name in _BATCH_FIELD_NAMES})
+
+    def columns(self) -> dict[str, list[Any]]:
+        """Return the columns keyed by field name, in ExportRecord field order."""
+        return dict(zip(_BATCH_FIELD_NAMES, _BATCH_COLUMNS(self)))
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Convert back to one dict per row."""
+        names = _BATCH_FIELD_NAMES
+        return [dict(zip(names, values)) for values in zip(*_BATCH_COLUMNS(self))]
+
+
+# Field metadata is read once here; attrs.fields()/asdict() are not used at runtime.
+_BATCH_FIELD_NAMES: tuple[str, ...] = tuple(
+    field.name for field in ExportRecordBatch.__attrs_attrs__
+)
+_BATCH_COLUMNS = attrgetter(*_BATCH_FIELD_NAMES)  # batch -> tuple of its columns
+_FIELDS: tuple[attrs.Attribute, ...] = tuple(ExportRecord.__attrs_attrs__)
+
+
+# Field names and accepted types, read off the attrs instance_of validators, so
+# rows can be type-checked without constructing an ExportRecord.
+_FIELD_TYPES: tuple[tuple[str, type | tuple[type, ...]], ...] = tuple(
+    (field.name, field.validator.type) for field in _FIELDS
+)
+_FIELD_NAMES: frozenset[str] = frozenset(name for name, _ in _FIELD_TYPES)
+
+
+def _make_fast_from_dict() -> Callable[[dict[str, Any]], ExportRecord]:
+    """Generate ExportRecord.from_dict with the field reads and type checks unrolled.
+
+    The generated function reads each field with a literal key, checks the same
+    types as the attrs validators and fills the slots directly. Anything else
+    (missing/extra keys, wrong types, dict subclasses) goes through
+    `ExportRecord(**data)`, so errors are exactly the attrs ones.
+    """
+    names = [name for name, _ in _FIELD_TYPES]
+    checks = " and ".join(f"isinstance(v{i}, t{i})" for i in range(len(names)))
+    source = "\n".join(
+        [
+            "def fast_from_dict(d):",
+            f"    if type(d) is dict and len(d) == {len(names)}:",
+            "        try:",
+            *(f"            v{i} = d[{name!r}]" for i, name in enumerate(names)),
+            "        except KeyError:",
+            "            return cls(**d)",
+            f"        if {checks}:",
+            "            obj = new(cls)",
+            *(f"            setattr_(obj, {name!r}, v{i})" for i, name in enumerate(names)),
+            "            return obj",
+            "    return cls(**d)",
+        ]
+    )
+    namespace: dict[str, Any] = {
+        "cls": ExportRecord,
+        "new": object.__new__,
+        "setattr_": object.__setattr__,
+        **{f"t{i}": types for i, (_, types) in enumerate(_FIELD_TYPES)},
+    }
+    exec(source, namespace)
+    return namespace["fast_from_dict"]
+
+
+_fast_from_dict = _make_fast_from_dict()
+
+
+def _make_row_is_valid() -> Callable[[Any], bool]:
+    """Generate `_row_is_valid` as a single expression over literal field keys."""
+    checks = "".join(
+        f" and isinstance(row[{name!r}], t{i})" for i, (name, _) in enumerate(_FIELD_TYPES)
+    )
+    source = (
+        f"def row_is_valid(row):\n    return isinstance(row, dict) and row.keys() == names{checks}"
+    )
+    namespace: dict[str, Any] = {
+        "names": _FIELD_NAMES,
+        **{f"t{i}": types for i, (_, types) in enumerate(_FIELD_TYPES)},
+    }
+    exec(source, namespace)
+    return namespace["row_is_valid"]
+
+
+# _row_is_valid(row) is True if `row` would construct a valid ExportRecord: it is
+# equivalent to `ExportRecord.from_dict(row)` succeeding (exact key set, isinstance
+# checks per field) but does not allocate the record.
+_row_is_valid = _make_row_is_valid()
+
+_FIELD_GETTER = itemgetter(*(name for name, _ in _FIELD_TYPES))
+
+
+@functools.lru_cache(maxsize=65536, typed=True)
+def _interned_record(
+    event_type: str,
+    location_name: str,
+    sku_name: str,
+    quantity: Union[int, float],
+    value: Union[int, float],
+    created_at: datetime,
+    tzinfo: Any,
+    fold: int,
+    quantity_sign: float,
+    value_sign: float,
+) -> ExportRecord:
+    """Shared record for already-validated values (see `ExportRecord.from_dict`).
+
+    `tzinfo`, `fold` and the signs are only part of the cache key: equal aware
+    datetimes in different time zones, or differing only in fold, and 0.0 vs
+    -0.0, are distinct records.
+    """
+    return ExportRecord._unchecked(event_type, location_name, sku_name, quantity, value, created_at)
+
+
+def validate_batch(records: list[ExportRecord]) -> None:
+    """Run the ExportRecord field checks over records built without validation.
+
+    Companion to `ExportRecord.from_dict_unchecked`: each field is checked across
+    all records in one C-level pass, and only if a check fails is the first
+    offending record run through `attrs.validate` to raise its usual TypeError.
+    """
+    for name, types in _FIELD_TYPES:
+        if not all(map(isinstance, map(attrgetter(name), records), repeat(types))):
+            for record in records:
+                attrs.validate(record)
+
 
 def validate_and_convert_records(
     data: list[dict[str, Any]],
@@ -73,19 +302,26 @@ def validate_and_convert_records(
     """
     if strict:
         # Convert to structured ExportRecord objects using attrs directly
-        # This provides better control and handles Union types correctly
+        # This provides better control and handles Union types correctly.
+        # The generated builder checks and fills valid rows in one call, without
+        # running the attrs validators; other rows get the regular constructor.
+        fast_from_dict = _fast_from_dict
         try:
-            return [ExportRecord.from_dict(item) for item in data]
+            return [fast_from_dict(item) for item in data]
         except (TypeError, KeyError) as e:
             raise ValueError(f"Failed to convert to ExportRecord: {e}") from e
     else:
-        # Validate structure by attempting to create ExportRecord objects
-        # but return original dicts (backward compatible)
-        try:
-            for item in data:
-                # Validate by creating (but not storing) ExportRecord
-                ExportRecord.from_dict(item)
+        # Validate structure without allocating ExportRecord objects and return the
+        # original dicts (backward compatible). Valid data is checked in one C-level
+        # all(map(...)) pass; otherwise the rows failing the fast check are run
+        # through ExportRecord construction so the error message is the attrs one.
+        if all(map(_row_is_valid, data)):
             return data
-        except (TypeError, KeyError) as e:
-            raise ValueError(f"Validation failed: {e}") from e
+        for item in data:
+            if not _row_is_valid(item):
+                try:
+                    ExportRecord.from_dict(item)
+                except (TypeError, KeyError) as e:
+                    raise ValueError(f"Validation failed: {e}") from e
+        return data
 
@@ -71,6 +71,37 @@ class InstrumentedCache(ExportCache):
         return super().set(key, data)
 
 
+def test_cache_subclass_keeps_original_signature() -> None:
+    """Test that get/set overrides without `now` keep working; ExportCache itself gets it."""
+    cache = InstrumentedCache()
+    exp = DataExporter(cache=cache)
+    data = [{"n": i} for i in range(20)]
+    assert exp.export(data, ExportFormat.CSV) == exp.export(data, ExportFormat.CSV)
+    assert (cache.get_calls, cache.set_calls) == (2, 1)
+
+    plain = ExportCache()
+    assert DataExporter(cache=plain)._cache_get == plain.get
+
+
+def test_shared_cache_does_not_skip_validation() -> None:
+    """Test that a validating exporter still rejects data another exporter cached unvalidated."""
+    from data import data as test_data
+
+    invalid = [dict(row, quantity="many") for row in test_data]
+    cache = ExportCache()
+    assert DataExporter(cache=cache).export(invalid, ExportFormat.CSV)
+
+    validating = DataExporter(cache=cache, validate_input=True)
+    with pytest.raises(ValueError):
+        validating.export(invalid, ExportFormat.CSV)
+
+    exp = DataExporter(cache=cache)
+    exp.export(invalid, ExportFormat.JSON)
+    exp.validate_input = True
+    with pytest.raises(ValueError):
+        exp.export(invalid, ExportFormat.JSON)
+
+
 def test_cache_is_used() -> None:
     """Test that cache is used for repeated exports."""
     data = [{"n": i} for i in range(3)]
@@ -429,3 +460,488 @@ def test_real_dataset_roundtrip() -> None:
     assert len(csv_rows) == len(test_data)
     # All datetime fields should be strings in CSV
     assert isinstance(csv_rows[0]["created_at"], str)
+
+
+def test_cache_key_blake2b_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that cache keys fall back to BLAKE2b when xxhash is unavailable."""
+    from boost_exporter import exporter as exporter_module
+
+    monkeypatch.setattr(exporter_module, "xxhash", None)
+    data = [{"a": i} for i in range(20)]  # large enough to be hashed
+    key = DataExporter._compute_cache_key(data, ExportFormat.JSON)
+
+    assert isinstance(key, bytes)
+    assert len(key) == 16
+    assert key == DataExporter._compute_cache_key(list(data), ExportFormat.JSON)
+    assert key != DataExporter._compute_cache_key(data, ExportFormat.CSV)
+
+
+def test_json_export_stdlib_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that JSON export and cache keys work without orjson installed."""
+    from boost_exporter import exporter as exporter_module
+
+    data = [{"b": datetime(2024, 1, 15, 10, 30), "a": 1}]
+    with_orjson = DataExporter().export(data, ExportFormat.JSON)
+
+    monkeypatch.setattr(exporter_module, "orjson", None)
+    without_orjson = DataExporter().export(data, ExportFormat.JSON)
+
+    # Both backends emit the same canonical (sorted, compact) JSON for these values;
+    # see test_json_export_floats_match_across_backends for floats
+    assert with_orjson == without_orjson
+    assert json.loads(without_orjson) == [{"a": 1, "b": "2024-01-15T10:30:00"}]
+
+
+def test_json_export_floats_match_across_backends(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test float output with and without orjson: NaN/inf are kept, values agree."""
+    from boost_exporter import exporter as exporter_module
+
+    data = [{"big": 1e16, "small": 1e-7, "x": 0.1, "none": None}, {"nan": float("nan")}]
+    nested = [{"values": [1.5, float("inf")], "neg": {"v": float("-inf")}}]
+
+    with_orjson = [DataExporter().export(d, ExportFormat.JSON) for d in (data, nested)]
+    monkeypatch.setattr(exporter_module, "orjson", None)
+    without_orjson = [DataExporter().export(d, ExportFormat.JSON) for d in (data, nested)]
+
+    # Non-finite floats always go through stdlib json, so the text is identical
+    assert with_orjson == without_orjson
+    assert '"nan":NaN' in with_orjson[0]
+    assert with_orjson[1] == '[{"neg":{"v":-Infinity},"values":[1.5,Infinity]}]'
+
+    # Finite floats may be formatted differently (1e16 vs 1e+16) but parse the same
+    finite = [{"big": 1e16, "small": 1e-7, "x": 0.1}]
+    monkeypatch.undo()
+    fast = DataExporter().export(finite, ExportFormat.JSON)
+    monkeypatch.setattr(exporter_module, "orjson", None)
+    assert json.loads(fast) == json.loads(DataExporter().export(finite, ExportFormat.JSON))
+
+
+def test_csv_export_non_str_header_keys() -> None:
+    """Test that non-str keys in the header are written as csv.writer writes them."""
+    assert DataExporter().export([{None: 1, "a": 2}], ExportFormat.CSV) == ",a\r\n1,2\r\n"
+    assert DataExporter().export([{1: "x", "a": 2.5}], ExportFormat.CSV) == "1,a\r\nx,2.5\r\n"
+
+
+def test_has_non_finite_float() -> None:
+    """Test the NaN/inf check behind the orjson fallback on flat, float and nested cells."""
+    from boost_exporter.exporter import _has_non_finite_float
+
+    class Ratio(float):
+        pass
+
+    inf = float("inf")
+    assert not _has_non_finite_float([{"a": None, "b": "x", "c": 1}])
+    assert not _has_non_finite_float([{"a": 1.5, "b": None}, {"a": -2.0}])
+    assert _has_non_finite_float([{"a": inf}, {"a": -inf}])  # sums to NaN
+    assert _has_non_finite_float([{"a": Ratio("nan")}])
+    assert _has_non_finite_float([{"a": [1, {"b": (2.0, -inf)}]}])
+    assert not _has_non_finite_float([{"a": [1.0, None]}])
+    assert _has_non_finite_float({"value": [1.0, float("nan")]})  # batch columns
+
+
+def test_json_export_mixed_key_types(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that rows mixing int and str keys export with and without orjson."""
+    from boost_exporter import exporter as exporter_module
+
+    data = [{1: "a", "b": 2}] * 20  # large enough to be hashed
+    with_orjson = DataExporter().export(data, ExportFormat.JSON)
+    assert json.loads(with_orjson) == [{"1": "a", "b": 2}] * 20
+
+    monkeypatch.setattr(exporter_module, "orjson", None)
+    exp = DataExporter()
+    without_orjson = exp.export(data, ExportFormat.JSON)
+    assert json.loads(without_orjson) == [{"1": "a", "b": 2}] * 20
+    assert exp.export(data, ExportFormat.JSON) == without_orjson  # repr-keyed cache hit
+    assert len(exp.cache._store) == 1
+    assert exp.export([{1: "a", "b": 2}], ExportFormat.JSON) == '[{"1":"a","b":2}]'
+
+    with pytest.raises(ValueError, match="Failed to encode JSON"):
+        exp.export([{1: object(), "b": 2}], ExportFormat.JSON)
+
+
+def test_csv_mixed_column_types() -> None:
+    """Test CSV columns mixing primitives with values that need conversion."""
+    exp = DataExporter()
+    data = [
+        {"when": datetime(2024, 1, 15, 10, 30), "tags": None, "n": 1},
+        {"when": None, "tags": ["a", "b"], "n": 2.5},
+    ]
+
+    rows = list(csv.DictReader(io.StringIO(exp.export(data, ExportFormat.CSV))))
+    assert rows[0] == {"when": "2024-01-15T10:30:00", "tags": "", "n": "1"}
+    assert rows[1] == {"when": "", "tags": '["a", "b"]', "n": "2.5"}
+
+
+def test_csv_same_keys_different_order() -> None:
+    """Test CSV values stay aligned with the header when rows order keys differently."""
+    exp = DataExporter()
+    data = [{"b": 1, "a": 2}, {"a": 3, "b": 4}]
+
+    out = exp.export(data, ExportFormat.CSV)
+    assert out.splitlines() == ["b,a", "1,2", "4,3"]
+
+
+def test_cache_uses_supplied_clock() -> None:
+    """Test that an explicit `now` drives expiry instead of reading the clock."""
+    cache = ExportCache(ttl_seconds=10)
+    cache.set("k", "v", now=100.0)
+
+    assert cache.get("k", now=105.0) == "v"
+    assert cache.get("k", now=111.0) is None
+
+
+def test_cache_get_refreshes_recency() -> None:
+    """Test that a cache hit protects an entry from the next LRU eviction."""
+    cache = ExportCache(max_size=2)  # lru_mode="strict" by default
+    cache.set("a", "1")
+    cache.set("b", "2")
+
+    assert cache.get("a") == "1"  # "b" is now least recently used
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+def test_cache_can_be_replaced() -> None:
+    """Test that assigning a new cache redirects subsequent exports to it."""
+    exp = DataExporter()
+    replacement = InstrumentedCache()
+    exp.cache = replacement
+
+    exp.export([{"id": 1}], ExportFormat.JSON)
+    assert exp.cache is replacement
+    assert replacement.get_calls == 1
+    assert replacement.set_calls == 1
+
+
+def test_json_export_non_string_keys() -> None:
+    """Test that non-string keys are stringified like stdlib json does."""
+    exp = DataExporter()
+    out = exp.export([{1: "one", 2: "two"}], ExportFormat.JSON)
+    assert json.loads(out) == [{"1": "one", "2": "two"}]
+
+
+def test_small_cache_key_distinguishes_types() -> None:
+    """Test that small datasets get content keys that keep 1, True and "1" apart."""
+    exp = DataExporter()
+    outputs = [exp.export([{"v": v}], ExportFormat.JSON) for v in (1, True, "1", 1.0)]
+    assert [json.loads(o)[0]["v"] for o in outputs] == [1, True, "1", 1.0]
+
+    key = exp._compute_cache_key([{"v": 1}], ExportFormat.JSON)
+    assert isinstance(key, tuple)
+    assert not isinstance(exp._compute_cache_key([{"v": 1.0}], ExportFormat.JSON), tuple)
+
+
+def test_export_record_batch_matches_row_export() -> None:
+    """Test that exporting a columnar batch gives the same output as its rows."""
+    from boost_exporter import ExportRecordBatch
+    from data import data as test_data
+
+    exp = DataExporter()
+    batch = ExportRecordBatch.from_dicts(test_data)
+
+    assert exp.export(batch, ExportFormat.CSV) == exp.export(test_data, ExportFormat.CSV)
+    assert exp.export(batch, ExportFormat.JSON) == exp.export(test_data, ExportFormat.JSON)
+
+
+def test_export_record_batch_non_json_values() -> None:
+    """Test that a batch holding values json cannot encode is still keyed and cached."""
+    from decimal import Decimal
+
+    from boost_exporter import ExportRecordBatch
+    from data import data as test_data
+
+    rows = [dict(row, value=Decimal(row["value"]) / 100) for row in test_data]
+    batch = ExportRecordBatch.from_dicts(rows)
+    cache = InstrumentedCache()
+    exp = DataExporter(cache=cache)
+
+    first = exp.export(batch, ExportFormat.CSV)
+    assert first == DataExporter().export(rows, ExportFormat.CSV)
+    assert exp.export(batch, ExportFormat.CSV) == first
+    assert cache.set_calls == 1
+
+
+def test_to_primitive_handles_subclasses() -> None:
+    """Test that subclasses of supported types fall back to the isinstance path."""
+    from enum import IntEnum
+
+    class Level(IntEnum):
+        HIGH = 3
+
+    class Stamp(datetime):
+        pass
+
+    assert DataExporter._to_primitive(Level.HIGH) == 3
+    assert DataExporter._to_primitive(Stamp(2024, 1, 15, 10, 30)) == "2024-01-15T10:30:00"
+    assert DataExporter._to_primitive({"a": 1}) == '{"a": 1}'
+    assert DataExporter._to_primitive(None) == ""
+    assert DataExporter._json_default(Stamp(2024, 1, 15, 10, 30)) == "2024-01-15T10:30:00"
+
+
+def test_memoize_keys_skips_rehashing_same_list(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that memoize_keys reuses the key for the same list and notices appends."""
+    exp = DataExporter(memoize_keys=True)
+    data = [{"id": i, "value": i * 1.5} for i in range(50)]
+    first = exp.export(data, ExportFormat.JSON)
+
+    def fail(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("cache key should have been memoized")
+
+    monkeypatch.setattr(DataExporter, "_serialize_json_canonical", staticmethod(fail))
+    assert exp.export(data, ExportFormat.JSON) == first
+
+    monkeypatch.undo()
+    data.append({"id": 50, "value": 75.0})
+    assert len(json.loads(exp.export(data, ExportFormat.JSON))) == 51
+
+
+def test_csv_key_does_not_keep_json_payload() -> None:
+    """Test that the canonical JSON is only handed back when it is the JSON output."""
+    exp = DataExporter()
+    data = [{"id": i} for i in range(20)]
+
+    assert exp._key_and_payload(data, ExportFormat.CSV)[1] is None
+    assert exp._key_and_payload(data, ExportFormat.JSON)[1] is not None
+
+
+def test_cache_min_rows_bypasses_cache() -> None:
+    """Test that datasets below cache_min_rows are exported without caching."""
+    cache = ExportCache()
+    exp = DataExporter(cache=cache, cache_min_rows=3)
+    small = [{"a": 1}, {"a": 2}]
+    large = [{"a": 1}, {"a": 2}, {"a": 3}]
+
+    assert exp.export(small, ExportFormat.JSON) == '[{"a":1},{"a":2}]'
+    assert len(cache._store) == 0
+
+    exp.export(large, ExportFormat.JSON)
+    assert len(cache._store) == 1
+
+
+def test_memoize_keys_covers_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that memoize_keys also skips rehashing a repeated ExportRecordBatch."""
+    from boost_exporter import ExportRecordBatch
+    from data import data as test_data
+
+    exp = DataExporter(memoize_keys=True)
+    batch = ExportRecordBatch.from_dicts(test_data)
+    first = exp.export(batch, ExportFormat.CSV)
+
+    def fail(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("cache key should have been memoized")
+
+    monkeypatch.setattr(DataExporter, "_serialize_json_canonical", staticmethod(fail))
+    assert exp.export(batch, ExportFormat.CSV) == first
+
+
+def test_cache_approx_lru_promotes_every_eighth_hit() -> None:
+    """Test that approx LRU mode only reorders entries after repeated hits."""
+    cache = ExportCache(max_size=2, lru_mode="approx")
+    cache.set("a", "1")
+    cache.set("b", "2")
+
+    for _ in range(7):
+        assert cache.get("a") == "1"
+    assert list(cache._store) == ["a", "b"]  # not promoted yet
+
+    assert cache.get("a") == "1"  # 8th hit promotes
+    assert list(cache._store) == ["b", "a"]
+
+    cache.set("c", "3")
+    assert cache.get("b") is None
+
+
+def test_cache_approx_lru_gives_hit_entries_a_second_chance() -> None:
+    """Test that approx LRU eviction skips entries hit since their last promotion."""
+    cache = ExportCache(max_size=2, lru_mode="approx")
+    cache.set("a", "1")
+    cache.set("b", "2")
+
+    assert cache.get("a") == "1"  # one hit: not promoted, but counted
+    assert list(cache._store) == ["a", "b"]
+    cache.set("c", "3")
+
+    assert list(cache._store) == ["a", "c"]  # "b" evicted, "a" got its second chance
+    cache.set("d", "4")
+    assert list(cache._store) == ["c", "d"]  # the chance is used up
+
+
+def test_exporter_and_cache_use_slots() -> None:
+    """Test that instances carry no __dict__ while subclasses may add attributes."""
+    assert not hasattr(DataExporter(), "__dict__")
+    assert not hasattr(ExportCache(), "__dict__")
+
+    class TaggedCache(ExportCache):
+        pass
+
+    cache = TaggedCache()
+    cache.tag = "custom"  # type: ignore[attr-defined]
+    assert DataExporter(cache=cache).cache is cache
+
+
+def test_cache_rejects_unknown_lru_mode() -> None:
+    """Test that lru_mode is validated."""
+    with pytest.raises(ValueError, match="lru_mode"):
+        ExportCache(lru_mode="fifo")  # type: ignore[arg-type]
+
+
+def test_csv_plain_join_matches_csv_module() -> None:
+    """Test the hand-joined CSV fast path against csv.writer output."""
+    plain = [{"id": i, "name": f"Item {i}", "price": i / 4, "ok": i % 2 == 0} for i in range(20)]
+    needs_quoting = [{"id": 1, "name": "a,b"}, {"id": 2, "name": "line\nbreak"}]
+    quoted_header = [{"unit price": 1, "a,b": None, 'say "hi"': 3}]
+
+    for data in (plain, needs_quoting, quoted_header):
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(data[0].keys())
+        writer.writerows(row.values() for row in data)
+        assert DataExporter().export(data, ExportFormat.CSV) == buf.getvalue()
+
+    assert DataExporter._join_plain_rows(["id", "name"], needs_quoting) is None
+
+
+def test_csv_repeated_datetimes_keep_their_time_zones() -> None:
+    """Test that memoized ISO formatting never mixes up equal aware datetimes."""
+    from datetime import timedelta, timezone
+
+    utc = datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc)
+    plus_one = datetime(2024, 1, 15, 11, 0, tzinfo=timezone(timedelta(hours=1)))
+    naive = datetime(2024, 1, 15, 10, 0)
+    assert utc == plus_one
+
+    exp = DataExporter()
+    aware_rows = list(csv.DictReader(io.StringIO(
+        exp.export([{"t": utc}, {"t": plus_one}, {"t": utc}], ExportFormat.CSV)
+    )))
+    assert [r["t"] for r in aware_rows] == [
+        "2024-01-15T10:00:00+00:00",
+        "2024-01-15T11:00:00+01:00",
+        "2024-01-15T10:00:00+00:00",
+    ]
+
+    naive_rows = list(csv.DictReader(io.StringIO(
+        exp.export([{"t": naive}] * 3, ExportFormat.CSV)
+    )))
+    assert [r["t"] for r in naive_rows] == ["2024-01-15T10:00:00"] * 3
+
+
+def test_export_many_matches_export() -> None:
+    """Test that export_many returns per-dataset results in order and fills the cache."""
+    datasets = [
+        [{"id": i, "batch": b, "at": datetime(2024, 1, 1 + b)} for i in range(3000)]
+        for b in range(4)
+    ]
+    datasets.append(datasets[0])  # duplicate dataset in the same call
+    cache = InstrumentedCache()
+    exp = DataExporter(cache=cache)
+
+    results = exp.export_many(datasets, ExportFormat.CSV, max_workers=2)
+    expected = [DataExporter().export(d, ExportFormat.CSV) for d in datasets]
+    assert results == expected
+    assert cache.get_calls == 5
+
+    assert exp.export_many(datasets, ExportFormat.CSV) == expected
+    assert cache.set_calls == 5  # second call served from cache
+
+
+def test_export_many_validates_before_work() -> None:
+    """Test that export_many rejects invalid datasets up front."""
+    exp = DataExporter()
+    with pytest.raises(ValueError, match="data\\[1\\] is not a dict"):
+        exp.export_many([[{"a": i} for i in range(6000)], [{"a": 1}, "bad"]], ExportFormat.JSON)
+
+
+@pytest.mark.parametrize("rows", [1, 6000])
+def test_export_many_rejects_non_list_dataset(rows: int) -> None:
+    """Test that a non-list dataset raises ValueError on both the sequential and pooled paths."""
+    cache = InstrumentedCache()
+    exp = DataExporter(cache=cache)
+    with pytest.raises(ValueError, match="data must be a list of dictionaries"):
+        exp.export_many([[{"a": i} for i in range(rows)], 5], ExportFormat.JSON)  # type: ignore[list-item]
+    assert cache.get_calls == 0
+
+
+@pytest.mark.parametrize("rows", [5, 6000])
+def test_export_many_accepts_batches(rows: int) -> None:
+    """Test that ExportRecordBatch datasets are exported on both paths, as by export."""
+    from boost_exporter import ExportRecordBatch
+    from data import data as test_data
+
+    data = (test_data * (rows // len(test_data) + 1))[:rows]
+    batch = ExportRecordBatch.from_dicts(data)
+    exp = DataExporter()
+    for fmt in (ExportFormat.CSV, ExportFormat.JSON):
+        expected = [DataExporter().export(batch, fmt), DataExporter().export(data, fmt)]
+        assert exp.export_many([batch, data], fmt, max_workers=2) == expected
+
+
+def test_export_async_matches_export() -> None:
+    """Test that export_async gives the same output as export and shares its cache."""
+    import asyncio
+
+    from data import data as test_data
+
+    cache = ExportCache()
+    exp = DataExporter(cache=cache)
+
+    async def run() -> list[str]:
+        return list(
+            await asyncio.gather(
+                exp.export_async(test_data, ExportFormat.CSV),
+                exp.export_async(test_data, ExportFormat.JSON),
+            )
+        )
+
+    csv_out, json_out = asyncio.run(run())
+    assert len(cache._store) == 2
+    assert csv_out == exp.export(test_data, ExportFormat.CSV)
+    assert json_out == exp.export(test_data, ExportFormat.JSON)
+
+    with pytest.raises(ValueError, match="data must be a list of dictionaries"):
+        asyncio.run(exp.export_async({"a": 1}, ExportFormat.JSON))  # type: ignore[arg-type]
+
+
+def test_export_async_follows_export_options() -> None:
+    """Test that export_async handles batches, cache_min_rows and memoize_keys like export."""
+    import asyncio
+
+    from boost_exporter import ExportRecordBatch
+    from data import data as test_data
+
+    batch = ExportRecordBatch.from_dicts(test_data)
+    cache = InstrumentedCache()
+    exp = DataExporter(cache=cache, cache_min_rows=5, memoize_keys=True)
+
+    assert asyncio.run(exp.export_async(batch, ExportFormat.CSV)) == exp.export(
+        test_data, ExportFormat.CSV
+    )
+    assert asyncio.run(exp.export_async(test_data[:3], ExportFormat.JSON)) == exp.export(
+        test_data[:3], ExportFormat.JSON
+    )
+    assert cache.get_calls == 2  # the batch and test_data; the 3 rows skip the cache
+    assert (id(batch), ExportFormat.CSV) in exp._key_memo
+
+
+def test_export_many_follows_export_options() -> None:
+    """Test that the pooled export_many path honours cache_min_rows."""
+    big = [{"a": i} for i in range(6000)]
+    cache = InstrumentedCache()
+    exp = DataExporter(cache=cache, cache_min_rows=10)
+
+    results = exp.export_many([big, big[:3], big], ExportFormat.CSV, max_workers=2)
+    assert results == [DataExporter().export(d, ExportFormat.CSV) for d in (big, big[:3], big)]
+    assert cache.get_calls == 2
+
+
+def test_json_export_numpy_values() -> None:
+    """Test that numpy scalars and arrays are exported when orjson is available."""
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("orjson")
+
+    exp = DataExporter()
+    out = exp.export([{"n": np.int64(3), "xs": np.array([1.5, 2.5])}], ExportFormat.JSON)
+    assert json.loads(out) == [{"n": 3, "xs": [1.5, 2.5]}]
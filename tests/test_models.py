@@ -72,6 +72,8 @@ def test_export_record_to_dict() -> None:
     assert result["event_type"] == "Receive"
     assert result["quantity"] == 10
     assert isinstance(result["created_at"], datetime)
+    assert result == attrs.asdict(record)
+    assert list(result) == [field.name for field in attrs.fields(ExportRecord)]
 
 
 def test_export_record_from_dict() -> None:
@@ -232,3 +234,232 @@ def test_exporter_without_validation_backward_compatible() -> None:
     assert result is not None
     assert "any" in result
 
+
+
+def test_validate_and_convert_records_non_strict_rejects_extra_fields() -> None:
+    """Test that non-strict validation rejects the same rows ExportRecord does."""
+    row = {
+        "event_type": "Receive",
+        "location_name": "Warehouse",
+        "sku_name": "Product ABC",
+        "quantity": 10,
+        "value": 1000,
+        "created_at": datetime(2024, 1, 15, 10, 30, 0),
+    }
+    assert validate_and_convert_records([row], strict=False) == [row]
+
+    with pytest.raises(ValueError, match="unexpected keyword argument 'extra'"):
+        validate_and_convert_records([{**row, "extra": 1}], strict=False)
+
+    with pytest.raises(ValueError, match="Validation failed"):
+        validate_and_convert_records([{**row, "created_at": "2024-01-15"}], strict=False)
+
+
+def test_export_record_batch_roundtrip() -> None:
+    """Test converting between row dicts, ExportRecords and a columnar batch."""
+    from boost_exporter import ExportRecordBatch
+
+    rows = [
+        {
+            "event_type": "Receive",
+            "location_name": "Warehouse",
+            "sku_name": "Product ABC",
+            "quantity": 10,
+            "value": 1000,
+            "created_at": datetime(2024, 1, 15, 10, 30, 0),
+        },
+        {
+            "event_type": "Ship",
+            "location_name": "Store",
+            "sku_name": "Product XYZ",
+            "quantity": 5.5,
+            "value": 500,
+            "created_at": datetime(2024, 1, 16, 14, 0, 0),
+        },
+    ]
+
+    batch = ExportRecordBatch.from_dicts(rows)
+    assert len(batch) == 2
+    assert batch.quantity == [10, 5.5]
+    assert batch.to_dicts() == rows
+
+    records = [ExportRecord.from_dict(row) for row in rows]
+    assert ExportRecordBatch.from_records(records) == batch
+
+
+def test_export_record_batch_rejects_ragged_columns() -> None:
+    """Test that all batch columns must have the same length."""
+    from boost_exporter import ExportRecordBatch
+
+    with pytest.raises(ValueError, match="same length"):
+        ExportRecordBatch(
+            event_type=["Receive"],
+            location_name=["Warehouse"],
+            sku_name=["Product ABC"],
+            quantity=[1, 2],
+            value=[1],
+            created_at=[datetime(2024, 1, 15)],
+        )
+
+
+def test_exporter_validation_skipped_on_cache_hit(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that validate_input validates on every call unless validate_on_hit=False."""
+    from boost_exporter import DataExporter, ExportFormat
+    from boost_exporter import exporter as exporter_module
+
+    calls = []
+    original = exporter_module.validate_and_convert_records
+
+    def counting_validate(data, strict=False):  # type: ignore[no-untyped-def]
+        calls.append(len(data))
+        return original(data, strict=strict)
+
+    monkeypatch.setattr(exporter_module, "validate_and_convert_records", counting_validate)
+    data = [
+        {
+            "event_type": "Receive",
+            "location_name": "Warehouse",
+            "sku_name": "Product ABC",
+            "quantity": 10,
+            "value": 1000,
+            "created_at": datetime(2024, 1, 15, 10, 30, 0)
+        }
+    ]
+
+    exp = DataExporter(validate_input=True, validate_on_hit=False)
+    exp.export(data, ExportFormat.JSON)
+    exp.export(data, ExportFormat.JSON)
+    assert calls == [1]
+
+    exp = DataExporter(validate_input=True)
+    exp.export(data, ExportFormat.JSON)
+    exp.export(data, ExportFormat.JSON)
+    assert calls == [1, 1, 1]
+
+
+def test_exporter_validation_not_bypassed_by_cache_hit() -> None:
+    """Test that rows whose JSON matches a validated dataset's are still rejected."""
+    from boost_exporter import DataExporter, ExportFormat
+
+    data = [
+        {
+            "event_type": "Receive",
+            "location_name": "Warehouse",
+            "sku_name": "Product ABC",
+            "quantity": 10,
+            "value": 1000,
+            "created_at": datetime(2024, 1, 15, 10, 30, 0)
+        }
+    ] * 20
+    as_strings = [dict(row, created_at=row["created_at"].isoformat()) for row in data]
+
+    exp = DataExporter(validate_input=True)
+    for fmt in (ExportFormat.JSON, ExportFormat.CSV):
+        exp.export(data, fmt)
+        with pytest.raises(ValueError):
+            exp.export(as_strings, fmt)
+
+
+def test_export_record_unchecked_matches_validated() -> None:
+    """Test that the private unchecked constructor builds equal, frozen records."""
+    fields = dict(
+        event_type="Receive",
+        location_name="Warehouse",
+        sku_name="Product ABC",
+        quantity=10,
+        value=1000,
+        created_at=datetime(2024, 1, 15, 10, 30, 0)
+    )
+    record = ExportRecord._unchecked(**fields)
+
+    assert record == ExportRecord(**fields)
+    assert hash(record) == hash(ExportRecord(**fields))
+    with pytest.raises(attrs.exceptions.FrozenInstanceError):
+        record.quantity = 20
+
+
+def test_export_record_from_dict_errors_match_constructor() -> None:
+    """Test that the generated from_dict fast path raises the constructor's errors."""
+    fields = dict(
+        event_type="Receive",
+        location_name="Warehouse",
+        sku_name="Product ABC",
+        quantity=10,
+        value=1000,
+        created_at=datetime(2024, 1, 15, 10, 30, 0)
+    )
+    assert ExportRecord.from_dict(fields) == ExportRecord(**fields)
+
+    bad_rows = [
+        {**fields, "quantity": "10"},  # wrong type
+        {k: v for k, v in fields.items() if k != "value"},  # missing field
+        {**fields, "extra": 1},  # unexpected field
+    ]
+    for row in bad_rows:
+        with pytest.raises(TypeError) as expected:
+            ExportRecord(**row)
+        with pytest.raises(TypeError) as actual:
+            ExportRecord.from_dict(row)
+        assert str(actual.value) == str(expected.value)
+
+
+def test_export_record_from_dict_intern_shares_equal_rows() -> None:
+    """Test that interned records are shared only between equivalent rows."""
+    from datetime import timedelta, timezone
+
+    row = {
+        "event_type": "Receive",
+        "location_name": "Warehouse",
+        "sku_name": "Product ABC",
+        "quantity": 10,
+        "value": 1000,
+        "created_at": datetime(2024, 1, 15, 10, 30, 0)
+    }
+
+    first = ExportRecord.from_dict(dict(row), intern=True)
+    assert ExportRecord.from_dict(dict(row), intern=True) is first
+    assert ExportRecord.from_dict(row) is not first
+
+    as_float = ExportRecord.from_dict({**row, "quantity": 10.0}, intern=True)
+    assert as_float is not first
+    assert isinstance(as_float.quantity, float)
+
+    for zero in (0.0, -0.0):  # equal and same hash, but written differently
+        record = ExportRecord.from_dict({**row, "quantity": zero, "value": zero}, intern=True)
+        assert str(record.quantity) == str(record.value) == str(zero)
+
+    utc = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+    plus_one = utc.astimezone(timezone(timedelta(hours=1)))
+    for created_at in (plus_one, utc):  # equal instants, different time zones
+        record = ExportRecord.from_dict({**row, "created_at": created_at}, intern=True)
+        assert record.created_at.isoformat() == created_at.isoformat()
+
+    with pytest.raises(TypeError):
+        ExportRecord.from_dict({**row, "quantity": "10"}, intern=True)
+
+
+def test_from_dict_unchecked_and_validate_batch() -> None:
+    """Test building records without validators and checking them afterwards."""
+    from boost_exporter import validate_batch
+
+    row = {
+        "event_type": "Receive",
+        "location_name": "Warehouse",
+        "sku_name": "Product ABC",
+        "quantity": 10,
+        "value": 1000,
+        "created_at": datetime(2024, 1, 15, 10, 30, 0)
+    }
+    records = [ExportRecord.from_dict_unchecked(row) for _ in range(3)]
+    assert records[0] == ExportRecord.from_dict(row)
+    validate_batch(records)
+
+    records.append(ExportRecord.from_dict_unchecked({**row, "quantity": "10"}))
+    with pytest.raises(TypeError) as actual:
+        validate_batch(records)
+    with pytest.raises(TypeError) as expected:
+        ExportRecord.from_dict({**row, "quantity": "10"})
+    assert str(actual.value) == str(expected.value)
+
+    with pytest.raises(TypeError):
+        ExportRecord.from_dict_unchecked({**row, "extra": 1})